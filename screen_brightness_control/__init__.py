@@ -1,13 +1,16 @@
 import logging
-import platform
+import sys
 import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import ModuleType
 from typing import Callable, Any, Dict, List, Optional, Tuple, Type, Union, FrozenSet, ClassVar
 from ._version import __author__, __version__  # noqa: F401
 from .exceptions import NoValidDisplayError, format_exc
-from .helpers import (BrightnessMethod, ScreenBrightnessError,
+from .helpers import (BrightnessMethod, ScreenBrightnessError, __Cache,
                       logarithmic_range, percentage)
 from .types import DisplayIdentifier, IntPercentage, Percentage
 from . import config
@@ -16,6 +19,12 @@ from . import config
 _logger = logging.getLogger(__name__)
 _logger.addHandler(logging.NullHandler())
 
+__cache__ = __Cache()
+_IS_LINUX = sys.platform.startswith('linux')
+'''Whether we are running on Linux, where the minimum brightness is 1 unless forced'''
+_FILTER_MONITORS_KWARGS = frozenset(('display', 'haystack', 'method', 'include', 'allow_duplicates', 'retry'))
+'''Keyword arguments accepted by `filter_monitors`'''
+
 
 @config.default_params
 def get_brightness(
@@ -114,28 +123,24 @@ def set_brightness(
         sbc.set_brightness(50, display=0)
         ```
     '''
-    if isinstance(value, str) and ('+' in value or '-' in value):
-        output: List[Union[IntPercentage, None]] = []
-        for monitor in filter_monitors(display=display, method=method, allow_duplicates=allow_duplicates):
-            # `filter_monitors()` will raise an error if no valid displays are found
-            display_instance = Display.from_dict(monitor)
-            display_instance.set_brightness(value=value, force=force)
-            output.append(None if no_return else display_instance.get_brightness())
-
-        return None if no_return else output
-
-    if platform.system() == 'Linux' and not force:
+    if _IS_LINUX and not force:
         lower_bound = 1
     else:
         lower_bound = 0
 
-    value = percentage(value, lower_bound=lower_bound)
+    relative = isinstance(value, str) and value.strip().startswith(('+', '-'))
+    if relative:
+        # parse the relative value once. `__brightness` applies it to each display's current brightness
+        value = int(float(value))
+    else:
+        value = percentage(value, lower_bound=lower_bound)
 
     return __brightness(
         value, display=display, method=method,
         meta_method='set', no_return=no_return,
         allow_duplicates=allow_duplicates,
-        verbose_error=verbose_error
+        verbose_error=verbose_error,
+        relative=relative, lower_bound=lower_bound
     )
 
 
@@ -149,6 +154,7 @@ def fade_brightness(
     force: bool = False,
     logarithmic: bool = True,
     stoppable: bool = True,
+    duration: Optional[float] = None,
     **kwargs
 ) -> Union[List[threading.Thread], List[Union[IntPercentage, None]]]:
     '''
@@ -167,12 +173,14 @@ def fade_brightness(
             If True, this check is bypassed
         logarithmic: follow a logarithmic brightness curve when adjusting the brightness
         stoppable: whether the fade can be stopped by starting a new fade on the same display
+        duration: the total time the fade should take, in seconds. Steps are spread evenly across
+            this time and any steps that fall behind schedule are skipped. Overrides `interval`.
+            A duration of 0 or less sets the brightness to `finish` straight away
         **kwargs: passed through to `filter_monitors` for display selection.
-            Will also be passed to `get_brightness` if `blocking is True`
 
     Returns:
-        By default, this function calls `get_brightness()` to return the new
-        brightness of any adjusted displays.
+        By default, this function returns the new brightness of any adjusted displays.
+        Displays whose brightness cannot be determined after the fade will return None.
 
         If `blocking` is set to `False`, then a list of threads are
         returned, one for each display being faded.
@@ -195,27 +203,32 @@ def fade_brightness(
 
         # fade the brightness to 100% in a new thread
         sbc.fade_brightness(100, blocking=False)
+
+        # fade the brightness to 0% over the course of 2 seconds
+        sbc.fade_brightness(0, duration=2)
         ```
     '''
     # make sure only compatible kwargs are passed to filter_monitors
     available_monitors = filter_monitors(
-        **{k: v for k, v in kwargs.items() if k in (
-            'display', 'haystack', 'method', 'include', 'allow_duplicates'
-        )}
+        **{k: kwargs[k] for k in kwargs.keys() & _FILTER_MONITORS_KWARGS}
     )
 
+    # each fade records the brightness it finished on, so we don't have to query the displays afterwards
+    final_values: List[Union[IntPercentage, None]] = [None] * len(available_monitors)
+
+    def fade(index: int, display: Display):
+        final_values[index] = display._fade_brightness(
+            finish, start=start, interval=interval, increment=increment, force=force,
+            logarithmic=logarithmic, stoppable=stoppable, duration=duration
+        )
+
     threads = []
-    for i in available_monitors:
+    displays = []
+    for index, i in enumerate(available_monitors):
         display = Display.from_dict(i)
+        displays.append(display)
 
-        thread = threading.Thread(target=display._fade_brightness, args=(finish,), kwargs={
-            'start': start,
-            'interval': interval,
-            'increment': increment,
-            'force': force,
-            'logarithmic': logarithmic,
-            'stoppable': stoppable
-        })
+        thread = threading.Thread(target=fade, args=(index, display))
         thread.start()
         threads.append(thread)
 
@@ -224,7 +237,17 @@ def fade_brightness(
 
     for t in threads:
         t.join()
-    return get_brightness(**kwargs)
+
+    output: List[Union[IntPercentage, None]] = []
+    for display, value in zip(displays, final_values):
+        if value is None:
+            # the fade was stopped early or failed, so we don't know what brightness it ended up on
+            try:
+                value = display.get_brightness()
+            except Exception as e:
+                display._logger.error(f'failed to get brightness after fade - {format_exc(e)}')
+        output.append(value)
+    return output
 
 
 @config.default_params
@@ -232,7 +255,11 @@ def list_monitors_info(
     method: Optional[str] = None, allow_duplicates: Optional[bool] = None, unsupported: bool = False
 ) -> List[dict]:
     '''
-    List detailed information about all displays that are controllable by this library
+    List detailed information about all displays that are controllable by this library.
+    Results are cached briefly, so displays connected within the last few seconds may not be listed.
+    On top of the 2 second cache here, each OS backend caches its own display detection, so results
+    can be up to around 4 seconds old on Linux and 3 seconds old on Windows.
+    See `invalidate_monitor_cache`.
 
     Args:
         method: the method to use to list the available displays. See `get_methods` for
@@ -269,9 +296,38 @@ def list_monitors_info(
             print('UID:', display['uid'])
         ```
     '''
-    return _OS_MODULE.list_monitors_info(
-        method=method, allow_duplicates=allow_duplicates, unsupported=unsupported
-    )
+    # enumerating displays can take a long time, so cache the result briefly to avoid
+    # re-enumerating on every call when adjusting the brightness many times in a row
+    cache_ident = f'list_monitors_info_{method}_{allow_duplicates}_{unsupported}'
+    info = __cache__.get(cache_ident)
+    if info is None:
+        info = _OS_MODULE.list_monitors_info(
+            method=method, allow_duplicates=allow_duplicates, unsupported=unsupported
+        )
+        # don't cache empty results. `filter_monitors` retries those, so they should be re-enumerated
+        if info:
+            __cache__.store(cache_ident, info, expires=2)
+    # return copies so that callers can't modify the cached info
+    return [dict(i) for i in info]
+
+
+def invalidate_monitor_cache():
+    '''
+    Clears the cached results of `list_monitors_info`, along with the display info cached by
+    each OS backend, forcing the next call to re-detect all displays.
+    Useful if a display has only just been connected.
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        # a new display was connected a moment ago
+        sbc.invalidate_monitor_cache()
+        print(sbc.list_monitors())
+        ```
+    '''
+    __cache__.expire(startswith='list_monitors_info_')
+    _OS_MODULE._invalidate_display_info_cache()
 
 
 @config.default_params
@@ -316,10 +372,11 @@ def get_methods(name: Optional[str] = None) -> Dict[str, Type[BrightnessMethod]]
             print('Associated monitors:', sbc.list_monitors(method=method_name))
         ```
     '''
-    methods: Dict[str, type[BrightnessMethod]] = {i.__name__.lower(): i for i in _OS_MODULE.METHODS}
+    methods = _method_lookup(_OS_MODULE.METHODS)
 
     if name is None:
-        return methods
+        # return a copy so the cached lookup can't be modified
+        return dict(methods)
 
     if not isinstance(name, str):
         raise TypeError(f'name must be of type str, not {type(name)!r}')
@@ -333,6 +390,12 @@ def get_methods(name: Optional[str] = None) -> Dict[str, Type[BrightnessMethod]]
         f'invalid method {name!r}, must be one of: {list(methods)}')
 
 
+@lru_cache(maxsize=None)
+def _method_lookup(methods: Tuple[Type[BrightnessMethod], ...]) -> Dict[str, Type[BrightnessMethod]]:
+    '''internal function to map lowercase method names to their classes'''
+    return {i.__name__.lower(): i for i in methods}
+
+
 @dataclass
 class Display():
     '''
@@ -361,13 +424,15 @@ class Display():
     serial: Optional[str] = None
     '''The serial number of the display or (if serial is not available) an ID assigned by the OS'''
 
+    # defined before `_logger` so that the module level logger is referenced, not the field
+    _class_logger: ClassVar[logging.Logger] = _logger.getChild('Display')
+    '''Parent of the per-instance loggers, created once rather than on every init'''
     _logger: logging.Logger = field(init=False, repr=False)
     _fade_thread_dict: ClassVar[Dict[FrozenSet[Any], threading.Thread]] = {}
     '''A dictionary mapping display identifiers to latest fade threads for stopping fades.'''
 
     def __post_init__(self):
-        self._logger = _logger.getChild(self.__class__.__name__).getChild(
-            str(self.get_identifier()[1])[:20])
+        self._logger = self._class_logger.getChild(str(self.get_identifier()[1])[:20])
 
     def fade_brightness(
         self,
@@ -378,7 +443,8 @@ class Display():
         force: bool = False,
         logarithmic: bool = True,
         blocking: bool = True,
-        stoppable: bool = True
+        stoppable: bool = True,
+        duration: Optional[float] = None
     ) -> Optional[threading.Thread]:
         '''
         Gradually change the brightness of this display to a set value.
@@ -399,6 +465,9 @@ class Display():
                 See `logarithmic_range` for rationale
             blocking: run this function in the current thread and block until it completes
             stoppable: whether this fade will be stopped by starting a new fade on the same display
+            duration: the total time the fade should take, in seconds. Steps are spread evenly across
+                this time and any steps that fall behind schedule are skipped. Overrides `interval`.
+                A duration of 0 or less sets the brightness to `finish` straight away
 
         Returns:
             If `blocking` is `False`, returns a `threading.Thread` object representing the
@@ -411,7 +480,8 @@ class Display():
             'increment': increment,
             'force': force,
             'logarithmic': logarithmic,
-            'stoppable': stoppable
+            'stoppable': stoppable,
+            'duration': duration
         })
         thread.start()
 
@@ -429,13 +499,20 @@ class Display():
         increment: int = 1,
         force: bool = False,
         logarithmic: bool = True,
-        stoppable: bool = True
-    ) -> None:
+        stoppable: bool = True,
+        duration: Optional[float] = None
+    ) -> Optional[IntPercentage]:
+        '''
+        Runs the fade in the current thread. See `Display.fade_brightness` for the full docs
+
+        Returns:
+            The brightness the fade finished on, or None if the fade was stopped early
+        '''
         # Record the latest thread for this display so that other stoppable threads can be stopped
         display_key = frozenset((self.method, self.index))
         self._fade_thread_dict[display_key] = threading.current_thread()
         # minimum brightness value
-        if platform.system() == 'Linux' and not force:
+        if _IS_LINUX and not force:
             lower_bound = 1
         else:
             lower_bound = 0
@@ -452,29 +529,47 @@ class Display():
         if start > finish:
             increment = -increment
 
-        self._logger.debug(
-            f'fade {start}->{finish}:{increment}:logarithmic={logarithmic}')
+        self._logger.debug('fade %s->%s:%s:logarithmic=%s', start, finish, increment, logarithmic)
 
-        # Record the time when the next brightness change should start
-        next_change_start_time = time.time()
-        for value in range_func(start, finish, increment):
-            if stoppable and threading.current_thread() != self._fade_thread_dict[display_key]:
+        if duration is not None and duration <= 0:
+            # no time to fade in, so skip straight to the final step
+            values = []
+        else:
+            values = list(range_func(start, finish, increment))
+            # `logarithmic_range` can include `finish`, which is always set in the final step anyway
+            if values and values[-1] == finish:
+                values.pop()
+        # the intended time between the start of each brightness change
+        step_time = interval if duration is None else duration / max(len(values), 1)
+
+        # use a monotonic clock so that changes to the system time don't affect the schedule
+        start_time = time.monotonic()
+        current_thread = threading.current_thread()
+        stopped = False
+        index = 0
+        while index < len(values):
+            if stoppable and current_thread != self._fade_thread_dict[display_key]:
                 # If the current thread is stoppable and it's not the latest thread, stop fading
+                stopped = True
                 break
             # `value` is ensured not to hit `finish` in loop, this will be handled in the final step.
-            self.set_brightness(value, force=force)
+            self.set_brightness(values[index], force=force)
+            index += 1
 
-            # `interval` is the intended time between the start of each brightness change.
-            next_change_start_time += interval
-            sleep_time = next_change_start_time - time.time()
-            # Skip sleep if the scheduled time has already passed
+            sleep_time = start_time + (index * step_time) - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
-        else:
-            # As `value` doesn't hit `finish` in loop, we explicitly set brightness to `finish`.
-            # This also avoids an unnecessary sleep in the last iteration.
-            if not stoppable or threading.current_thread() == self._fade_thread_dict[display_key]:
-                self.set_brightness(finish, force=force)
+            elif duration is not None:
+                # we are behind schedule. Skip any overdue steps so that the fade still ends on time
+                index = max(index, int((time.monotonic() - start_time) / step_time))
+
+        # As `value` doesn't hit `finish` in loop, we explicitly set brightness to `finish`.
+        # This also avoids an unnecessary sleep in the last iteration.
+        # A new fade may have started during the final sleep, so check once more before the last step
+        if stopped or (stoppable and current_thread != self._fade_thread_dict[display_key]):
+            return None
+        self.set_brightness(finish, force=force)
+        return finish
 
     @classmethod
     def from_dict(cls, display: dict) -> 'Display':
@@ -514,10 +609,14 @@ class Display():
             The name of the property returned and the value of said property.
             EG: `('serial', '123abc...')` or `('name', 'BenQ GL2450H')`
         '''
-        for key in ('uid', 'edid', 'serial', 'name'):
-            value = getattr(self, key, None)
-            if value is not None:
-                return key, value
+        if self.uid is not None:
+            return 'uid', self.uid
+        if self.edid is not None:
+            return 'edid', self.edid
+        if self.serial is not None:
+            return 'serial', self.serial
+        if self.name is not None:
+            return 'name', self.name
         # the index should surely never be `None`
         return 'index', self.index
 
@@ -545,7 +644,7 @@ class Display():
                 because setting the brightness of 0 will often turn off the backlight
         '''
         # convert brightness value to percentage
-        if platform.system() == 'Linux' and not force:
+        if _IS_LINUX and not force:
             lower_bound = 1
         else:
             lower_bound = 0
@@ -565,7 +664,8 @@ def filter_monitors(
     haystack: Optional[List[dict]] = None,
     method: Optional[str] = None,
     include: List[str] = [],
-    allow_duplicates: Optional[bool] = None
+    allow_duplicates: Optional[bool] = None,
+    retry: Optional[bool] = None
 ) -> List[dict]:
     '''
     Searches through the information for all detected displays
@@ -580,6 +680,9 @@ def filter_monitors(
             more info on available methods
         include: extra fields of information to sort by
         allow_duplicates: controls whether to filter out duplicate displays or not
+        retry: if no displays are detected, try detecting them again a few times before giving up.
+            Useful when displays have only just been connected or woken up.
+            Defaults to `.config.FILTER_RETRY`. Has no effect if `haystack` is provided
 
     Raises:
         NoValidDisplayError: if the display does not have a match
@@ -607,13 +710,18 @@ def filter_monitors(
             if method is not None:
                 method_class = next(iter(get_methods(method).values()))
                 monitors_with_duplicates = [
-                    i for i in haystack if i['method'] == method_class]
+                    i for i in haystack if i['method'] is method_class]
         else:
             monitors_with_duplicates = list_monitors_info(
                 method=method, allow_duplicates=True)
 
         return monitors_with_duplicates
 
+    # the order of identifiers is the order of priority when matching and de-duplicating displays
+    identifiers = ('uid', 'edid', 'serial', 'name', *include)
+    display_is_str = isinstance(display, str)
+    display_is_int = isinstance(display, int)
+
     def filter_monitor_list(to_filter):
         # This loop does two things:
         # 1. Filters out duplicate monitors
@@ -628,52 +736,51 @@ def filter_monitors(
                 # 'display' variable should be the index of the monitor
                 # return a list with the monitor at the index or an empty list if the index is out of range
                 return to_filter[display:display + 1]
-            elif isinstance(display, str):
+            else:
                 # 'display' variable should be an identifier of the monitor
                 # multiple monitors with the same identifier are allowed here, so return all of them
-                monitors = []
-                for monitor in to_filter:
-                    for identifier in ['uid', 'edid', 'serial', 'name'] + include:
-                        if display == monitor.get(identifier, None):
-                            monitors.append(monitor)
-                            break
-                return monitors
+                return [
+                    monitor for monitor in to_filter
+                    if any(display == monitor.get(identifier) for identifier in identifiers)
+                ]
 
         filtered_displays = {}
         for monitor in to_filter:
             # find a valid identifier for a monitor, excluding any which are equal to None
-            added = False
-            for identifier in ['uid', 'edid', 'serial', 'name'] + include:
-                if monitor.get(identifier, None) is None:
+            for identifier in identifiers:
+                m_id = monitor.get(identifier)
+                if m_id is None:
                     continue
 
-                m_id = monitor[identifier]
                 if m_id in filtered_displays:
+                    # we have already added this monitor
                     break
 
-                if isinstance(display, str) and m_id != display:
+                if display_is_str and m_id != display:
                     continue
 
-                # check we haven't already added the monitor
-                if not added:
-                    filtered_displays[m_id] = monitor
-                    added = True
+                filtered_displays[m_id] = monitor
 
                 # if the display kwarg is an integer and we are currently at that index
-                if isinstance(display, int) and len(filtered_displays) - 1 == display:
+                if display_is_int and len(filtered_displays) - 1 == display:
                     return [monitor]
-
-                if added:
-                    break
+                break
         return list(filtered_displays.values())
 
-    duplicates = []
-    for _ in range(3):
-        duplicates = get_monitor_list()
-        if duplicates:
-            break
-        time.sleep(0.4)
-    else:
+    if retry is None:
+        retry = config.FILTER_RETRY
+
+    duplicates = get_monitor_list()
+    # retrying won't change the outcome if we were given the list of displays
+    if retry and haystack is None:
+        # display enumeration can be flaky, so try again a few times with increasing delays
+        for delay in (0.1, 0.2, 0.4):
+            if duplicates:
+                break
+            time.sleep(delay)
+            duplicates = get_monitor_list()
+
+    if not duplicates:
         msg = 'no displays detected'
         if method is not None:
             msg += f' with method: {method!r}'
@@ -700,69 +807,86 @@ def __brightness(
     no_return: bool = False,
     allow_duplicates: bool = False,
     verbose_error: bool = False,
+    relative: bool = False,
+    lower_bound: int = 0,
     **kwargs: Any
 ) -> Optional[List[Union[IntPercentage, None]]]:
-    '''Internal function used to get/set brightness'''
-    _logger.debug(
-        f"brightness {meta_method} request display {display} with method {method}")
+    '''
+    Internal function used to get/set brightness.
+
+    If `relative` is set, the value passed to set the brightness is added to the current
+    brightness of each display and bounded by `lower_bound`.
+    '''
+    # use lazy formatting so this costs nothing when debug logging is disabled
+    _logger.debug('brightness %s request display %s with method %s', meta_method, display, method)
 
     output: List[Union[int, None]] = []
-    errors = []
+    errors: List[Tuple[dict, Exception]] = []
 
-    for monitor in filter_monitors(display=display, method=method, allow_duplicates=allow_duplicates):
+    def call_method(monitor: dict) -> Tuple[List[Union[int, None]], Optional[Tuple[dict, Exception]]]:
         try:
             if meta_method == 'set':
+                set_args = args
+                if relative:
+                    current = monitor['method'].get_brightness(display=monitor['index'])[0]
+                    set_args = (percentage(current + args[0], lower_bound=lower_bound), *args[1:])
                 monitor['method'].set_brightness(
-                    *args, display=monitor['index'], **kwargs)
+                    *set_args, display=monitor['index'], **kwargs)
                 if no_return:
-                    output.append(None)
-                    continue
+                    return [None], None
 
-            output += monitor['method'].get_brightness(
-                display=monitor['index'], **kwargs)
+            return monitor['method'].get_brightness(
+                display=monitor['index'], **kwargs), None
         except Exception as e:
-            output.append(None)
-            errors.append((
-                monitor, e.__class__.__name__,
-                traceback.format_exc() if verbose_error else e
-            ))
+            # the exception keeps its `__traceback__`, so only format it if we end up raising
+            return [None], (monitor, e)
+
+    monitors = filter_monitors(display=display, method=method, allow_duplicates=allow_duplicates)
+    if config.PARALLEL_BACKEND and len(monitors) > 1:
+        # brightness methods spend most of their time waiting on I/O, so query each display in
+        # its own thread. `Executor.map` preserves the order the displays were submitted in
+        with ThreadPoolExecutor(max_workers=min(8, len(monitors)), thread_name_prefix=__name__) as executor:
+            results = list(executor.map(call_method, monitors))
+    else:
+        results = [call_method(monitor) for monitor in monitors]
+
+    for values, error in results:
+        output += values
+        if error is not None:
+            errors.append(error)
 
     if output:
-        output_is_none = set(output) == {None}
-        if (
-            # can't have None output if we are trying to get the brightness
-            (meta_method == 'get' and not output_is_none)
-            or (
-                # if we are setting the brightness then we CAN have a None output
-                # but only if no_return is True.
-                meta_method == 'set'
-                and ((no_return and output_is_none) or not output_is_none)
-            )
-        ):
+        # if we are setting the brightness then we CAN have a None output
+        # but only if no_return is True.
+        if meta_method == 'set' and no_return:
+            return None
+        # can't have None output if we are trying to get the brightness
+        if not all(value is None for value in output):
             return None if no_return else output
 
     # if the function hasn't returned then it has failed
-    msg = '\n'
+    msg = ['\n']
     if errors:
-        for monitor, exc_name, exc in errors:
-            if isinstance(monitor, str):
-                msg += f'\t{monitor}'
+        for monitor, exc in errors:
+            msg.append(f'\t{monitor["name"]} ({monitor["serial"]}) -> {exc.__class__.__name__}: ')
+            if verbose_error:
+                details = ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
             else:
-                msg += f'\t{monitor["name"]} ({monitor["serial"]})'
-            msg += f' -> {exc_name}: '
-            msg += str(exc).replace('\n', '\n\t\t') + '\n'
+                details = str(exc)
+            msg.append(details.replace('\n', '\n\t\t') + '\n')
     else:
-        msg += '\tno valid output was received from brightness methods'
+        msg.append('\tno valid output was received from brightness methods')
 
-    raise ScreenBrightnessError(msg)
+    raise ScreenBrightnessError(''.join(msg))
 
 
-if platform.system() == 'Windows':
+_OS_MODULE: ModuleType
+if sys.platform == 'win32':
     from . import windows
     _OS_MODULE = windows
-elif platform.system() == 'Linux':
+elif _IS_LINUX:
     from . import linux
     _OS_MODULE = linux
 else:
     _logger.warning(
-        f'package imported on unsupported platform ({platform.system()})')
+        f'package imported on unsupported platform ({sys.platform})')
@@ -28,3 +28,16 @@ Default value for the `method` parameter in top-level functions.
 
 For available values, see `.get_methods`
 '''
+
+PARALLEL_BACKEND: bool = True
+'''
+Whether top-level functions that operate on multiple displays (eg: `.get_brightness` and
+`.set_brightness`) should query each display concurrently, in its own thread.
+'''
+
+FILTER_RETRY: bool = False
+'''
+Default value for the `retry` parameter of `.filter_monitors`, which is used by all
+top-level functions to find displays. Enable this if your displays are sometimes
+not detected straight after being connected or woken up.
+'''
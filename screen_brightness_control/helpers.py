@@ -193,6 +193,7 @@ class __Cache:
     def __init__(self):
         self.logger = _logger.getChild(f'{self.__class__.__name__}_{id(self)}')
         self.enabled = True
+        self.max_size = 1024
         self._store: Dict[str, Tuple[Any, float]] = {}
 
     def expire(self, key: Optional[str] = None, startswith: Optional[str] = None):
@@ -206,35 +207,43 @@ class __Cache:
             key: a specific key to remove. `KeyError` exceptions are suppressed if this key doesn't exist.
             startswith: remove any keys that start with this string
         '''
-        if key is not None:
-            try:
-                del self._store[key]
-                self.logger.debug(f'delete key {key!r}')
-            except KeyError:
-                pass
-
-        for k, v in tuple(self._store.items()):
-            if startswith is not None and k.startswith(startswith):
-                del self._store[k]
-                self.logger.debug(f'delete keys {startswith=}')
-                continue
-            if v[1] < time.time():
-                del self._store[k]
-                self.logger.debug(f'delete expired key {k}')
+        if key is not None and self._store.pop(key, None) is not None:
+            self.logger.debug(f'delete key {key!r}')
+
+        now = time.time()
+        # displays may be queried from multiple threads at once, so snapshot the items before
+        # iterating and use `pop`, since another thread may have already removed a key
+        to_delete = [
+            k for k, v in tuple(self._store.items())
+            if v[1] < now or (startswith is not None and k.startswith(startswith))
+        ]
+        for k in to_delete:
+            self._store.pop(k, None)
+        if to_delete:
+            self.logger.debug(f'delete keys {to_delete} ({startswith=})')
 
     def get(self, key: str) -> Any:
         if not self.enabled:
             return None
         self.expire()
-        if key not in self._store:
+        item = self._store.get(key)
+        if item is None:
             self.logger.debug(f'{key!r} not present in cache')
             return None
-        return self._store[key][0]
+        return item[0]
 
     def store(self, key: str, value: Any, expires: float = 1):
         if not self.enabled:
             return
         self.logger.debug(f'cache set {key!r}, {expires=}')
+        if len(self._store) >= self.max_size:
+            self.expire()
+            # still full, so evict the oldest entries. Dicts preserve insertion order
+            while len(self._store) >= self.max_size:
+                oldest = next(iter(self._store), None)
+                if oldest is None:
+                    break
+                self._store.pop(oldest, None)
         self._store[key] = (value, expires + time.time())
 
 
@@ -273,10 +282,27 @@ class EDID:
     [pyedid](https://github.com/jojonas/pyedid/blob/2382910d968b2fa8de1fab495fbbdfebcdb39f19/pyedid/edid.py#L21),
     [Copyright 2019-2020 Jonas Lieb, Davydov Denis](https://github.com/jojonas/pyedid/blob/master/LICENSE).
     '''
+    _EDID_STRUCT = struct.Struct(
+        ">"     # big-endian
+        "8x"    # constant header (8 bytes)
+        "H"     # manufacturer id (2 bytes)
+        "44x"   # product id through to EDID supported timings (44 bytes)
+        "18s"   # timing / display descriptor block 1 (18 bytes)
+        "18s"   # timing / display descriptor block 2 (18 bytes)
+        "18s"   # timing / display descriptor block 3 (18 bytes)
+        "18s"   # timing / display descriptor block 4 (18 bytes)
+        "2x"    # extension flag and checksum (2 bytes)
+    )
+    '''
+    The parts of `EDID_FORMAT` used by `EDID.parse`, compiled once. Unused fields are skipped
+    rather than unpacked
+    '''
     SERIAL_DESCRIPTOR = bytes.fromhex('00 00 00 ff 00')
     NAME_DESCRIPTOR = bytes.fromhex('00 00 00 fc 00')
 
+    # EDIDs don't change and are re-parsed whenever displays are listed, so remember recent results
     @classmethod
+    @lru_cache(maxsize=32)
     def parse(cls, edid: Union[bytes, str]) -> Tuple[Union[str, None], ...]:
         '''
         Takes an EDID string and parses some relevant information from it according to the
@@ -316,15 +342,15 @@ class EDID:
             raise TypeError(f'edid must be of type bytes or str, not {type(edid)!r}')
 
         try:
-            blocks = struct.unpack(cls.EDID_FORMAT, edid)
+            mfg_id_bits, *descriptor_blocks = cls._EDID_STRUCT.unpack(edid)
         except struct.error as e:
             raise EDIDParseError('cannot unpack edid') from e
 
         # split mfg_id (2 bytes) into 3 letters, 5 bits each (ignoring reserved bit)
         mfg_id_chars = (
-            blocks[1] >> 10,             # First 6 bits (reserved bit at start is always 0)
-            (blocks[1] >> 5) & 0b11111,  # isolate next 5 bits from first 11 using bitwise AND
-            blocks[1] & 0b11111          # Last five bits
+            mfg_id_bits >> 10,             # First 6 bits (reserved bit at start is always 0)
+            (mfg_id_bits >> 5) & 0b11111,  # isolate next 5 bits from first 11 using bitwise AND
+            mfg_id_bits & 0b11111          # Last five bits
         )
         # turn numbers into ascii
         mfg_id = ''.join(chr(i + 64) for i in mfg_id_chars)
@@ -338,7 +364,7 @@ class EDID:
 
         serial = None
         name = None
-        for descriptor_block in blocks[17:21]:
+        for descriptor_block in descriptor_blocks:
             # decode the serial
             if descriptor_block.startswith(cls.SERIAL_DESCRIPTOR):
                 # strip descriptor bytes and trailing whitespace
@@ -471,23 +497,18 @@ def logarithmic_range(start: int, stop: int, step: int = 1) -> Generator[int, No
             last_yielded = x
 
 
+_BRANDS_BY_CODE = {k.lower(): (k, v) for k, v in MONITOR_MANUFACTURER_CODES.items()}
+'''Lowercase manufacturer codes mapped to their `(code, name)` pair'''
+# several codes share a name. Build in reverse so that the first code listed for a name wins
+_BRANDS_BY_NAME = {v.lower(): (k, v) for k, v in reversed(MONITOR_MANUFACTURER_CODES.items())}
+'''Lowercase manufacturer names mapped to their first `(code, name)` pair'''
+
+
 @lru_cache(maxsize=None)
 def _monitor_brand_lookup(search: str) -> Union[Tuple[str, str], None]:
     '''internal function to search the monitor manufacturer codes dict'''
-    keys = tuple(MONITOR_MANUFACTURER_CODES.keys())
-    keys_lower = tuple(map(str.lower, keys))
-    values = tuple(MONITOR_MANUFACTURER_CODES.values())
     search = search.lower()
-
-    if search in keys_lower:
-        index = keys_lower.index(search)
-    else:
-        values_lower = tuple(map(str.lower, values))
-        if search in values_lower:
-            index = values_lower.index(search)
-        else:
-            return None
-    return keys[index], values[index]
+    return _BRANDS_BY_CODE.get(search) or _BRANDS_BY_NAME.get(search)
 
 
 def percentage(
@@ -508,10 +529,13 @@ def percentage(
     Returns:
         `.types.IntPercentage`: The new brightness percentage, between `lower_bound` and 100
     '''
-    if isinstance(value, str) and ('+' in value or '-' in value):
+    if isinstance(value, str) and value.strip().startswith(('+', '-')):
         if callable(current):
             current = current()
         value = int(float(value)) + int(float(str(current)))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        # skip the string round trip for the common case of numeric values
+        value = int(value)
     else:
         value = int(float(str(value)))
 
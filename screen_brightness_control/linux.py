@@ -34,76 +34,83 @@ class SysFiles(BrightnessMethod):
 
     @classmethod
     def get_display_info(cls, display: Optional[DisplayIdentifier] = None) -> List[dict]:
-        subsystems = set()
-        for folder in os.listdir('/sys/class/backlight'):
-            if os.path.isdir(f'/sys/class/backlight/{folder}/subsystem'):
-                subsystems.add(tuple(os.listdir(f'/sys/class/backlight/{folder}/subsystem')))
-
-        displays_by_edid = {}
-        index = 0
-
-        # map drm devices to their pci device paths
-        drm_paths = {}
-        for folder in glob.glob('/sys/class/drm/card*-*'):
-            drm_paths[os.path.realpath(folder)] = folder
-
-        for subsystem in subsystems:
-
-            device: dict = {
-                'name': subsystem[0],
-                'path': f'/sys/class/backlight/{subsystem[0]}',
-                'method': cls,
-                'index': index,
-                'model': None,
-                'serial': None,
-                'manufacturer': None,
-                'manufacturer_id': None,
-                'edid': None,
-                'scale': None,
-                'uid': None
-            }
+        # scanning the backlight folders and parsing EDIDs is repeated for every brightness call,
+        # so keep the results around for a short while
+        all_displays = __cache__.get('sysfs_display_info')
+        if all_displays is None:
+            subsystems = set()
+            for folder in os.listdir('/sys/class/backlight'):
+                if os.path.isdir(f'/sys/class/backlight/{folder}/subsystem'):
+                    subsystems.add(tuple(os.listdir(f'/sys/class/backlight/{folder}/subsystem')))
 
-            for folder in subsystem:
-                # subsystems like intel_backlight usually have an acpi_video0
-                # counterpart, which we don't want so lets find the 'best' candidate
-                try:
-                    with open(f'/sys/class/backlight/{folder}/max_brightness') as f:
-                        # scale for SysFiles is just a multiplier for the set/get brightness values
-                        scale = int(f.read().rstrip(' \n')) / 100
-
-                    # use the display with the highest resolution scale
-                    if device['scale'] is None or scale > device['scale']:
-                        device['name'] = folder
-                        device['path'] = f'/sys/class/backlight/{folder}'
-                        device['scale'] = scale
-                except (FileNotFoundError, TypeError) as e:
-                    cls._logger.error(
-                        f'error getting highest resolution scale for {folder}'
-                        f' - {format_exc(e)}'
-                    )
-                    continue
+            displays_by_edid = {}
+            index = 0
 
-                # check if backlight subsystem device matches any of the PCI devices discovered earlier
-                # if so, extract the i2c bus from the drm device folder
-                pci_path = os.path.realpath(f'/sys/class/backlight/{folder}/device')
-                if pci_path in drm_paths:
-                    device['uid'] = device['uid'] or i2c_bus_from_drm_device(drm_paths[pci_path])
+            # map drm devices to their pci device paths
+            drm_paths = {}
+            for folder in glob.glob('/sys/class/drm/card*-*'):
+                drm_paths[os.path.realpath(folder)] = folder
 
-            if os.path.isfile('%s/device/edid' % device['path']):
-                device['edid'] = EDID.hexdump('%s/device/edid' % device['path'])
+            for subsystem in subsystems:
 
-                for key, value in zip(
-                    ('manufacturer_id', 'manufacturer', 'model', 'name', 'serial'),
-                    EDID.parse(device['edid'])
-                ):
-                    if value is None:
+                device: dict = {
+                    'name': subsystem[0],
+                    'path': f'/sys/class/backlight/{subsystem[0]}',
+                    'method': cls,
+                    'index': index,
+                    'model': None,
+                    'serial': None,
+                    'manufacturer': None,
+                    'manufacturer_id': None,
+                    'edid': None,
+                    'scale': None,
+                    'uid': None
+                }
+
+                for folder in subsystem:
+                    # subsystems like intel_backlight usually have an acpi_video0
+                    # counterpart, which we don't want so lets find the 'best' candidate
+                    try:
+                        with open(f'/sys/class/backlight/{folder}/max_brightness') as f:
+                            # scale for SysFiles is just a multiplier for the set/get brightness values
+                            scale = int(f.read()) / 100
+
+                        # use the display with the highest resolution scale
+                        if device['scale'] is None or scale > device['scale']:
+                            device['name'] = folder
+                            device['path'] = f'/sys/class/backlight/{folder}'
+                            device['scale'] = scale
+                    except (FileNotFoundError, TypeError) as e:
+                        cls._logger.error(
+                            f'error getting highest resolution scale for {folder}'
+                            f' - {format_exc(e)}'
+                        )
                         continue
-                    device[key] = value
 
-            displays_by_edid[device['edid']] = device
-            index += 1
+                    # check if backlight subsystem device matches any of the PCI devices discovered earlier
+                    # if so, extract the i2c bus from the drm device folder
+                    pci_path = os.path.realpath(f'/sys/class/backlight/{folder}/device')
+                    if pci_path in drm_paths:
+                        device['uid'] = device['uid'] or i2c_bus_from_drm_device(drm_paths[pci_path])
+
+                if os.path.isfile('%s/device/edid' % device['path']):
+                    device['edid'] = EDID.hexdump('%s/device/edid' % device['path'])
+
+                    for key, value in zip(
+                        ('manufacturer_id', 'manufacturer', 'model', 'name', 'serial'),
+                        EDID.parse(device['edid'])
+                    ):
+                        if value is None:
+                            continue
+                        device[key] = value
+
+                displays_by_edid[device['edid']] = device
+                index += 1
+
+            all_displays = list(displays_by_edid.values())
+            if all_displays:
+                __cache__.store('sysfs_display_info', all_displays, expires=2)
 
-        all_displays = list(displays_by_edid.values())
         if display is not None:
             all_displays = filter_monitors(
                 display=display, haystack=all_displays, include=['path'])
@@ -118,8 +125,9 @@ class SysFiles(BrightnessMethod):
         results = []
         for device in info:
             with open(os.path.join(device['path'], 'brightness'), 'r') as f:
-                brightness = int(f.read().rstrip('\n'))
-            results.append(int(brightness / device['scale']))
+                # `int` ignores the trailing newline, so there's no need to strip it
+                brightness = int(f.read())
+            results.append(round(brightness / device['scale']))
 
         return results
 
@@ -131,7 +139,7 @@ class SysFiles(BrightnessMethod):
 
         for device in info:
             with open(os.path.join(device['path'], 'brightness'), 'w') as f:
-                f.write(str(int(value * device['scale'])))
+                f.write(str(round(value * device['scale'])))
 
 
 class I2C(BrightnessMethod):
@@ -404,21 +412,26 @@ class I2C(BrightnessMethod):
 
         results = []
         for device in all_displays:
-            interface = cls.DDCInterface(device['i2c_bus'])
-            value, max_value = interface.getvcp(0x10)
+            # DDC reads are slow, so briefly reuse recent values like `DDCUtil` does
+            value = __cache__.get(f'i2c_brightness_{device["index"]}')
+            if value is None:
+                interface = cls.DDCInterface(device['i2c_bus'])
+                value, max_value = interface.getvcp(0x10)
 
-            # make sure display's max brighness is cached
-            cache_ident = '%s-%s-%s' % (device['name'],
-                                        device['model'], device['serial'])
-            if cache_ident not in cls._max_brightness_cache:
-                cls._max_brightness_cache[cache_ident] = max_value
-                cls._logger.info(
-                    f'{cache_ident} max brightness:{max_value} (current: {value})')
+                # make sure display's max brighness is cached
+                cache_ident = '%s-%s-%s' % (device['name'],
+                                            device['model'], device['serial'])
+                if cache_ident not in cls._max_brightness_cache:
+                    cls._max_brightness_cache[cache_ident] = max_value
+                    cls._logger.info(
+                        f'{cache_ident} max brightness:{max_value} (current: {value})')
 
-            if max_value != 100:
-                # if max value is not 100 then we have to adjust the scale to be
-                # a percentage
-                value = int((value / max_value) * 100)
+                if max_value != 100:
+                    # if max value is not 100 then we have to adjust the scale to be
+                    # a percentage
+                    value = int((value / max_value) * 100)
+
+                __cache__.store(f'i2c_brightness_{device["index"]}', value, expires=0.5)
 
             results.append(value)
 
@@ -437,13 +450,17 @@ class I2C(BrightnessMethod):
             if cache_ident not in cls._max_brightness_cache:
                 cls.get_brightness(display=device['index'])
 
-            # scale the brightness value according to the max brightness
+            # scale the brightness value according to the max brightness.
+            # Use a new name so the scaling isn't compounded for the next display
             max_value = cls._max_brightness_cache[cache_ident]
+            raw_value = value
             if max_value != 100:
-                value = int((value / 100) * max_value)
+                raw_value = int((value / 100) * max_value)
 
             interface = cls.DDCInterface(device['i2c_bus'])
-            interface.setvcp(0x10, value)
+            interface.setvcp(0x10, raw_value)
+            # expire after writing, since reading the max brightness above may have cached the old value
+            __cache__.expire(key=f'i2c_brightness_{device["index"]}')
 
 
 class XRandr(BrightnessMethodAdv):
@@ -451,6 +468,12 @@ class XRandr(BrightnessMethodAdv):
 
     executable: str = 'xrandr'
     '''the xrandr executable to be called'''
+    enable_current: bool = True
+    '''
+    Use the `--current` flag when calling xrandr. This returns the current screen configuration
+    without polling the hardware for changes, which is much faster but means newly connected
+    displays may not be picked up straight away.
+    '''
 
     @staticmethod
     def _get_uid(interface: str) -> Optional[str]:
@@ -493,7 +516,8 @@ class XRandr(BrightnessMethodAdv):
         Gets all displays reported by XRandr even if they're not supported
         '''
         xrandr_output = check_output(
-            [cls.executable, '--verbose']).decode().split('\n')
+            [cls.executable, '--verbose'] + (['--current'] if cls.enable_current else [])
+        ).decode().split('\n')
 
         display_count = 0
         tmp_display: dict = {}
@@ -774,12 +798,14 @@ class DDCUtil(BrightnessMethodAdv):
             if cache_ident not in cls._max_brightness_cache:
                 cls.get_brightness(display=monitor['index'])
 
+            # use a new name so the scaling isn't compounded for the next display
+            raw_value = value
             if cls._max_brightness_cache[cache_ident] != 100:
-                value = int((value / 100) * cls._max_brightness_cache[cache_ident])
+                raw_value = int((value / 100) * cls._max_brightness_cache[cache_ident])
 
             check_output(
                 [
-                    cls.executable, 'setvcp', '10', str(value),
+                    cls.executable, 'setvcp', '10', str(raw_value),
                     '-b', str(monitor['bus_number']),
                     f'--sleep-multiplier={cls.sleep_multiplier}'
                 ], max_tries=cls.cmd_max_tries
@@ -818,6 +844,17 @@ def i2c_bus_from_drm_device(dir: str) -> Optional[str]:
             return paths[0].replace('i2c-', '')
 
 
+def _invalidate_display_info_cache():
+    '''
+    @private
+
+    Removes the cached display info of every method, forcing them to re-detect displays
+    '''
+    __cache__.expire(key='sysfs_display_info')
+    __cache__.expire(key='i2c_display_info')
+    __cache__.expire(key='ddcutil_monitors_info')
+
+
 def list_monitors_info(
     method: Optional[str] = None, allow_duplicates: bool = False, unsupported: bool = False
 ) -> List[dict]:
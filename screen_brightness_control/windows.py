@@ -1,5 +1,6 @@
 import logging
 import re
+import threading
 import time
 from contextlib import contextmanager
 from ctypes import Structure, WinError, byref, windll
@@ -35,12 +36,34 @@ See also:
 '''
 
 
+_wmi_local = threading.local()
+'''Per-thread storage for reusable WMI connections. COM objects are bound to the thread that created them'''
+
+
 @contextmanager
 def _wmi_init():
-    '''internal function to create and return a wmi instance'''
+    '''
+    internal function to create and return a wmi instance
+
+    Connections are reused within a thread, but only if COM was already initialised on that thread.
+    Connections made after calling `CoInitialize` here are invalidated by the matching `CoUninitialize`,
+    so threads that never initialise COM themselves (EG: the short-lived workers used when
+    `config.PARALLEL_BACKEND` is enabled) still reconnect on every call.
+    '''
+    # connecting to the WMI namespace is slow, so reuse this thread's connection if there is one
+    cached = getattr(_wmi_local, 'wmi', None)
+    if cached is not None:
+        try:
+            yield cached
+        except Exception:
+            # the connection may have gone stale. Reconnect next time
+            _wmi_local.wmi = None
+            raise
+        return
+
     com_init = False
     try:
-        yield wmi.WMI(namespace='wmi')
+        instance = wmi.WMI(namespace='wmi')
     except Exception as e:
         # WMI init will fail outside the main thread, or if CoInitialize wasn't called first
         _logger.debug(f'WMI init failed ({e!r}). Calling CoInitialize and retrying')
@@ -50,11 +73,19 @@ def _wmi_init():
         else:
             pythoncom.CoInitializeEx(COM_MODEL)
 
-        yield wmi.WMI(namespace='wmi')
+        instance = wmi.WMI(namespace='wmi')
 
-    # only uninitialise if we initialised. Avoid cleaning up resources being used by another library
-    if com_init:
-        pythoncom.CoUninitialize()
+    try:
+        yield instance
+    finally:
+        # only uninitialise if we initialised. Avoid cleaning up resources being used by another library
+        if com_init:
+            pythoncom.CoUninitialize()
+
+    # only reached if the connection was used without error. Only cache connections made while COM
+    # was already initialised by someone else, since ours were invalidated by uninitialising above
+    if not com_init:
+        _wmi_local.wmi = instance
 
 
 def enum_display_devices() -> Generator[win32api.PyDISPLAY_DEVICEType, None, None]:
@@ -379,6 +410,15 @@ class VCP(BrightnessMethod):
                 break
 
 
+def _invalidate_display_info_cache():
+    '''
+    @private
+
+    Removes the cached display info, forcing `get_display_info` to re-detect displays
+    '''
+    __cache__.expire(key='windows_monitors_info_raw')
+
+
 def list_monitors_info(
     method: Optional[str] = None, allow_duplicates: bool = False, unsupported: bool = False
 ) -> List[dict]:
@@ -17,6 +17,8 @@ _OS_MODULE = sbc._OS_MODULE
 @pytest.fixture(autouse=True)
 def mock_os_module(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(sbc, '_OS_MODULE', os_module_mock)
+    # make sure display info cached by one test doesn't leak into the next
+    sbc.__cache__._store = {}
     return os_module_mock
 
 
@@ -275,7 +275,11 @@ class BrightnessFunctionTest(ABC):
                 else:
                     spy.assert_called_once_with(*args, display=display['index'])
 
-                assert result == (None if returns_none else [display['index']])
+                if operation_type == 'fade':
+                    # fades return the brightness they finished on
+                    assert result == [args[0]]
+                else:
+                    assert result == (None if returns_none else [display['index']])
 
                 spy.reset_mock()
 
@@ -28,6 +28,9 @@ class Method2(MockBrightnessMethod):
             'index': 0
         }]
 
+def _invalidate_display_info_cache():
+    pass
+
 def list_monitors_info(method = None, allow_duplicates = False, unsupported = False):
     info = []
     for m in METHODS:
@@ -1,4 +1,5 @@
 import itertools
+import struct
 import subprocess
 from unittest.mock import Mock, call, mock_open
 import pytest
@@ -29,6 +30,17 @@ class TestCache:
         # key should have been deleted as expired
         assert 'b' not in  cache._store
 
+    def test_store_is_bounded(self, cache):
+        cache.max_size = 3
+        cache.store('expired', 0, expires=-1)
+        for key in 'abc':
+            cache.store(key, 0)
+        # the expired entry goes first
+        assert list(cache._store) == ['a', 'b', 'c']
+        cache.store('d', 0)
+        # then the oldest live entry
+        assert list(cache._store) == ['b', 'c', 'd']
+
     @pytest.mark.parametrize('expires', [1, 3, 5, -1])
     def test_store(self, cache, expires: int):
         c_time = time.time()
@@ -53,6 +65,13 @@ class TestCache:
         # `expire` now expires all out of date keys automatically
         assert 'def' not in cache._store
 
+    def test_expire_startswith_keeps_unrelated_keys(self, cache):
+        cache.store('ab', 1)
+        cache.store('ac', 2)
+        cache.store('b', 3)
+        cache.expire(startswith='a')
+        assert list(cache._store) == ['b']
+
 
 class TestEDID:
     class TestParse:
@@ -88,16 +107,24 @@ class TestEDID:
             assert serial == serial_in
 
         def test_accepts_str_and_bytes(self, edid: str):
-            EDID.parse(edid)
-            EDID.parse(bytes.fromhex(edid))
+            assert EDID.parse(edid) == EDID.parse(bytes.fromhex(edid))
 
             with pytest.raises(TypeError):
                 EDID.parse(12345)  # type: ignore
 
+        def test_results_are_cached(self, edid: str):
+            result = EDID.parse(edid)
+            hits = EDID.parse.cache_info().hits
+            assert EDID.parse(edid) == result
+            assert EDID.parse.cache_info().hits == hits + 1
+
         def test_invalid_edid_struct_raises_error(self):
             with pytest.raises(sbc.helpers.EDIDParseError):
                 EDID.parse('00ff000000')
 
+        def test_parsing_struct_matches_edid_format(self):
+            assert EDID._EDID_STRUCT.size == struct.calcsize(EDID.EDID_FORMAT)
+
         class TestMfgId:
             @pytest.mark.parametrize('mfg_id_in', sbc.helpers.MONITOR_MANUFACTURER_CODES.keys())
             def test_monitor_manufacturer_id_is_parsed(self, mfg_id_in: str):
@@ -333,6 +360,10 @@ class TestPercentage:
         assert percentage('-21', current=lambda: 99) == 78
         assert percentage('+50', current=lambda: 50) == 100
         assert percentage('-10.5', current=100, lower_bound=10) == 90
+        assert percentage(' +10 ', current=10) == 20
+
+        # only a leading sign makes a value relative
+        assert percentage('1e-1', current=50) == 0
 
     def test_bounds(self):
         assert percentage(101) == 100
@@ -350,3 +381,5 @@ class TestPercentage:
             percentage([123]) # type: ignore
         with pytest.raises(ValueError):
             percentage('123{') # type: ignore
+        with pytest.raises(ValueError):
+            percentage(True) # type: ignore
@@ -27,6 +27,23 @@ class TestGetBrightness(BrightnessFunctionTest):
         assert all(isinstance(i, int) for i in brightness)
         assert all(0 <= i <= 100 for i in brightness)  # type: ignore
 
+    def test_parallel_backend_preserves_order(self, monkeypatch: pytest.MonkeyPatch, displays):
+        monkeypatch.setattr(sbc.config, 'PARALLEL_BACKEND', True)
+        parallel = sbc.get_brightness()
+        monkeypatch.setattr(sbc.config, 'PARALLEL_BACKEND', False)
+        assert parallel == sbc.get_brightness() == [d['index'] for d in displays]
+
+    @pytest.mark.parametrize('verbose_error', [True, False])
+    def test_verbose_error_kwarg(self, patch_methods, verbose_error: bool):
+        for patches in patch_methods.values():
+            patches['get'].side_effect = ValueError('broken')
+
+        with pytest.raises(sbc.ScreenBrightnessError) as exc_info:
+            sbc.get_brightness(verbose_error=verbose_error)
+        assert 'ValueError: ' in str(exc_info.value)
+        assert 'broken' in str(exc_info.value)
+        assert ('Traceback' in str(exc_info.value)) is verbose_error
+
 
 class TestSetBrightness(BrightnessFunctionTest):
     @pytest.fixture
@@ -52,7 +69,7 @@ class TestSetBrightness(BrightnessFunctionTest):
 
         @pytest.fixture(autouse=True, scope='function')
         def patch(self, mocker: MockerFixture, os_name: str):
-            mocker.patch.object(sbc.platform, 'system', new=lambda: os_name)
+            mocker.patch.object(sbc, '_IS_LINUX', new=os_name == 'Linux')
             self.percentage_spy = mocker.spy(sbc, 'percentage')
             self.brightness_spy = mocker.spy(sbc, '__brightness')
             self.lower_bound = 1 if os_name == 'Linux' else 0
@@ -79,8 +96,8 @@ class TestSetBrightness(BrightnessFunctionTest):
             self.percentage_spy = mocker.spy(sbc, 'percentage')
 
         def test_relative_values_are_calculated(self, mocker: MockerFixture):
-            mocker.patch.object(sbc.Display, 'get_brightness', new=lambda *a, **k: 10)
             display = sbc.Display.from_dict(sbc.list_monitors_info()[0])
+            mocker.patch.object(display.method, 'get_brightness', new=lambda *a, **k: [10])
             spy = mocker.spy(display.method, 'set_brightness')
 
             sbc.set_brightness('+5', display=0)
@@ -89,28 +106,44 @@ class TestSetBrightness(BrightnessFunctionTest):
             # check the result is passed to `set_brightness()` of `BrightnessMethod`
             spy.assert_called_once_with(15, display=display.index)
 
-        def test_current_value_if_get_brightness_fails(self, mocker: MockerFixture):
+        def test_relative_value_is_resolved_before_clamping(self, mocker: MockerFixture):
             '''
-            For relative brightnesses, we need to fetch the current brightness and add the relative
-            value to it. If `get_brightness` returns None (ie: fails) then we need a fallback behaviour
+            The relative value should be parsed once and added to the current brightness
+            of each display, leaving `percentage` to only apply the bounds
             '''
-            mocker.patch.object(sbc, 'get_brightness', new=lambda *a, **k: [None])
-            sbc.set_brightness('+10', display=0)
-            assert self.percentage_spy.mock_calls[0].kwargs.get('current') is not None
+            display = sbc.Display.from_dict(sbc.list_monitors_info()[0])
+            mocker.patch.object(display.method, 'get_brightness', new=lambda *a, **k: [95])
+            sbc.set_brightness('+10', display=0, force=True)
+            self.percentage_spy.assert_called_once_with(105, lower_bound=0)
+            assert self.percentage_spy.spy_return == 100
 
-        def test_relative_values_are_per_display(self, mocker: MockerFixture):
-            count = -1
+        def test_displays_are_only_enumerated_once(self, mocker: MockerFixture):
+            spy = mocker.spy(sbc, 'filter_monitors')
+            sbc.set_brightness('+10', no_return=False)
+            spy.assert_called_once()
 
-            def counter(*a, **kw):
-                nonlocal count
-                count += 1
-                return [count]
+        def test_relative_values_are_per_display(self, mocker: MockerFixture):
+            displays = sbc.list_monitors_info()
+            current = {(d['method'], d['index']): 10 * (i + 1) for i, d in enumerate(displays)}
+            setters = {}
+            for method in {d['method'] for d in displays}:
+                mocker.patch.object(
+                    method, 'get_brightness',
+                    Mock(side_effect=lambda display=None, method=method: [current[(method, display)]])
+                )
+                setters[method] = mocker.patch.object(method, 'set_brightness', Mock())
 
-            mocker.patch.object(sbc, 'get_brightness', new=counter)
             sbc.set_brightness('+10')
-            expected = [i + 10 for i in range(count + 1)]
-            actual = [call.args[0] for call in self.setter_spy.mock_calls[1:]]
-            assert expected == actual
+            for d in displays:
+                setters[d['method']].assert_any_call(current[(d['method'], d['index'])] + 10, display=d['index'])
+
+        @pytest.mark.parametrize('value', [' +10', '+10 ', ' -10'])
+        def test_whitespace_around_relative_values(self, mocker: MockerFixture, value: str):
+            display = sbc.Display.from_dict(sbc.list_monitors_info()[0])
+            mocker.patch.object(display.method, 'get_brightness', new=lambda *a, **k: [50])
+            spy = mocker.spy(display.method, 'set_brightness')
+            sbc.set_brightness(value, display=0)
+            spy.assert_called_once_with(50 + int(value), display=display.index)
 
 
 class TestFadeBrightness(BrightnessFunctionTest):
@@ -121,9 +154,19 @@ class TestFadeBrightness(BrightnessFunctionTest):
     def test_returns_new_brightness_by_default(self, displays):
         result = sbc.fade_brightness(100, interval=0)
         assert isinstance(result, list) and all(isinstance(i, int) for i in result)
+        assert result == [100] * len(displays)
+
+    def test_queries_brightness_of_stopped_fades(self, displays, mocker: MockerFixture):
+        mocker.patch.object(sbc.Display, '_fade_brightness', Mock(return_value=None))
+        result = sbc.fade_brightness(100, interval=0)
         # `type: ignore` because fade brightness could return `list[Thread]`
         assert sorted(result) == sorted(d['index'] for d in displays)  # type: ignore
 
+    def test_displays_are_only_enumerated_once(self, mocker: MockerFixture):
+        spy = mocker.spy(sbc, 'filter_monitors')
+        sbc.fade_brightness(100, interval=0)
+        spy.assert_called_once()
+
     def test_blocking_kwarg(self, subtests):
         threads = sbc.fade_brightness(100, blocking=False, interval=0)
         assert isinstance(threads, list) and all(isinstance(t, threading.Thread) for t in threads)
@@ -160,7 +203,8 @@ def test_list_monitors_info(mock_os_module, mocker: MockerFixture):
     '''
     `list_monitors_info` is just a shell for the OS specific variant
     '''
-    mock = mocker.patch.object(sbc._OS_MODULE, 'list_monitors_info', Mock(return_value=12345, spec=True))
+    mock_return = [{'name': '12345'}]
+    mock = mocker.patch.object(sbc._OS_MODULE, 'list_monitors_info', Mock(return_value=mock_return, spec=True))
     supported_kw = {
         'method': 123,
         'allow_duplicates': 456,
@@ -169,7 +213,23 @@ def test_list_monitors_info(mock_os_module, mocker: MockerFixture):
     result = sbc.list_monitors_info(**supported_kw)  # type: ignore
     # check that kwargs passed along and result passed back
     mock.assert_called_once_with(**supported_kw)
-    assert result == 12345
+    assert result == mock_return
+
+    # subsequent calls with the same kwargs should be served from the cache
+    assert sbc.list_monitors_info(**supported_kw) == mock_return  # type: ignore
+    mock.assert_called_once()
+    sbc.list_monitors_info(method=None)
+    assert mock.call_count == 2, 'different kwargs should not share a cache entry'
+
+    # callers should not be able to modify the cached info
+    sbc.list_monitors_info(**supported_kw)[0]['name'] = 'modified'  # type: ignore
+    assert sbc.list_monitors_info(**supported_kw) == mock_return  # type: ignore
+
+    backend_spy = mocker.spy(sbc._OS_MODULE, '_invalidate_display_info_cache')
+    sbc.invalidate_monitor_cache()
+    backend_spy.assert_called_once()
+    sbc.list_monitors_info(**supported_kw)  # type: ignore
+    assert mock.call_count == 3, 'cache should be cleared'
 
 
 def test_list_monitors(mock_os_module, mocker: MockerFixture):
@@ -251,6 +311,30 @@ class TestDisplay:
                 < timeit(lambda: display.fade_brightness(100, start=95, interval=0.05), number=1)
             ), 'longer interval should take more time'
 
+        def test_duration_kwarg(self, display: sbc.Display, mocker: MockerFixture):
+            duration = 0.2
+            elapsed = timeit(lambda: display.fade_brightness(100, start=0, duration=duration), number=1)
+            assert duration <= elapsed < duration * 2
+            assert display.get_brightness() == 100
+
+            def slow_setter(*a, **k):
+                time.sleep(0.01)
+
+            setter = mocker.patch.object(display, 'set_brightness', Mock(side_effect=slow_setter))
+            elapsed = timeit(
+                lambda: display.fade_brightness(100, start=0, duration=duration, logarithmic=False), number=1
+            )
+            assert elapsed < duration * 2, 'fade should stay on schedule when setting the brightness is slow'
+            assert len(setter.mock_calls) < 100, 'overdue steps should be skipped'
+            assert setter.mock_calls[-1].args[0] == 100
+
+        @pytest.mark.parametrize('duration', [0, -1])
+        def test_non_positive_duration(self, display: sbc.Display, mocker: MockerFixture, duration: float):
+            setter = mocker.spy(display, 'set_brightness')
+            display.fade_brightness(75, start=10, duration=duration)
+            assert [c.args[0] for c in setter.mock_calls] == [75]
+            assert display.get_brightness() == 75
+
         @pytest.mark.parametrize('increment', [1, 5, 10, 15])
         @pytest.mark.parametrize('start', [0, 100])
         def test_increment_kwarg(self, display: sbc.Display, mocker: MockerFixture, increment: int, start: int):
@@ -269,7 +353,7 @@ class TestDisplay:
 
         @pytest.mark.parametrize('os_name', ['Windows', 'Linux'])
         def test_force_kwarg(self, display: sbc.Display, mocker: MockerFixture, os_name: str):
-            mocker.patch.object(sbc.platform, 'system', new=lambda: os_name)
+            mocker.patch.object(sbc, '_IS_LINUX', new=os_name == 'Linux')
             lower_bound = 1 if os_name == 'Linux' else 0
             spy = mocker.spy(display, 'set_brightness')
 
@@ -317,6 +401,14 @@ class TestDisplay:
             # it should have also passed the `force` kwarg along to the final call
             assert 'force' in setter.mock_calls[-1].kwargs, 'force kwarg should be propagated'
 
+        def test_final_value_is_only_set_once(self, display: sbc.Display, mocker: MockerFixture):
+            mocker.patch.object(display, 'get_brightness', Mock(return_value=0))
+            setter = mocker.patch.object(display, 'set_brightness', autospec=True)
+            assert 100 in sbc.logarithmic_range(0, 100), 'setup has gone wrong!'
+
+            display.fade_brightness(100, start=0, interval=0)
+            assert [call.args[0] for call in setter.mock_calls].count(100) == 1
+
         def test_stoppable_kwarg(self, display: sbc.Display, mocker: MockerFixture):
             start = 1
             finish = 20             # smaller value could introduce errors; greater value will extend the test.
@@ -436,7 +528,7 @@ class TestDisplay:
 
         @pytest.mark.parametrize('os_name', ['Windows', 'Linux'])
         def test_force_kwarg(self, display: sbc.Display, mocker: MockerFixture, os_name: str):
-            mocker.patch.object(sbc.platform, 'system', new=lambda: os_name)
+            mocker.patch.object(sbc, '_IS_LINUX', new=os_name == 'Linux')
             lower_bound = 1 if os_name == 'Linux' else 0
             spy = mocker.spy(display.method, 'set_brightness')
 
@@ -455,11 +547,40 @@ class TestFilterMonitors:
         assert all(isinstance(i, dict) for i in filtered)
 
     def test_raises_exception_when_no_displays_detected(self, mocker: MockerFixture):
-        mocker.patch.object(sbc, 'list_monitors_info', Mock(spec=True, return_value=[]))
-        # filter_monitors sleeps 0.4s between retries. patch that to speed up tests
-        mocker.patch.object(sbc.time, 'sleep', Mock())
+        mock = mocker.patch.object(sbc, 'list_monitors_info', Mock(spec=True, return_value=[]))
+        sleep = mocker.patch.object(sbc.time, 'sleep', Mock())
         with pytest.raises(sbc.NoValidDisplayError):
             sbc.filter_monitors()
+        # no retries by default
+        mock.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_retry_kwarg(self, mocker: MockerFixture):
+        displays = sbc.list_monitors_info()
+        mock = mocker.patch.object(sbc, 'list_monitors_info', Mock(spec=True, return_value=[]))
+        # filter_monitors sleeps between retries. patch that to speed up tests
+        mocker.patch.object(sbc.time, 'sleep', Mock())
+        with pytest.raises(sbc.NoValidDisplayError):
+            sbc.filter_monitors(retry=True)
+        assert mock.call_count > 1
+
+        mock.reset_mock()
+        mock.side_effect = [[], displays]
+        assert sbc.filter_monitors(retry=True) == sbc.filter_monitors(haystack=displays)
+
+    def test_retry_kwarg_with_haystack(self, mocker: MockerFixture):
+        sleep = mocker.patch.object(sbc.time, 'sleep', Mock())
+        with pytest.raises(sbc.NoValidDisplayError):
+            sbc.filter_monitors(haystack=[], retry=True)
+        sleep.assert_not_called()
+
+    def test_retry_defaults_to_config(self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch):
+        displays = sbc.list_monitors_info()
+        mocker.patch.object(sbc, 'list_monitors_info', Mock(spec=True, side_effect=[[], displays]))
+        mocker.patch.object(sbc.time, 'sleep', Mock())
+        monkeypatch.setattr(sbc.config, 'FILTER_RETRY', True)
+        # get_brightness has no retry kwarg, so this relies on the config value
+        assert sbc.get_brightness() is not None
 
     class TestDisplayKwarg:
         sample_monitors: List[dict]
@@ -1,4 +1,5 @@
 import glob
+import io
 import os
 import re
 from typing import Type
@@ -17,6 +18,10 @@ from .helpers import BrightnessMethodTest
 
 
 class TestSysFiles(BrightnessMethodTest):
+    @pytest.fixture(scope='function', autouse=True)
+    def cleanup(self):
+        sbc.linux.__cache__._store = {}
+
     @pytest.fixture
     def patch_get_display_info(self, mocker: MockerFixture):
         '''Mock everything needed to get `SysFiles.get_display_info` to run'''
@@ -58,6 +63,16 @@ class TestSysFiles(BrightnessMethodTest):
             display = method.get_display_info()[0]
             assert display['scale'] == max_brightness / 100
 
+        def test_results_are_cached(self, mocker: MockerFixture, original_os_module, method: Type[BrightnessMethod]):
+            mocker.patch.object(sbc, '_OS_MODULE', original_os_module)
+            spy = mocker.spy(os, 'listdir')
+            assert method.get_display_info() == method.get_display_info()
+            assert spy.call_args_list.count(call('/sys/class/backlight')) == 1
+            # newly connected backlights should be picked up after invalidating
+            sbc.invalidate_monitor_cache()
+            method.get_display_info()
+            assert spy.call_args_list.count(call('/sys/class/backlight')) == 2
+
     class TestGetBrightness(BrightnessMethodTest.TestGetBrightness):
         class TestDisplayKwarg(BrightnessMethodTest.TestGetBrightness.TestDisplayKwarg):
             def test_with(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info, subtests):
@@ -83,7 +98,20 @@ class TestSysFiles(BrightnessMethodTest):
             mocker.patch.object(method, 'get_display_info', Mock(return_value=[display]), spec=True)
             mocker.patch.object(sbc.linux, 'open', mocker.mock_open(read_data=str(brightness)), spec=True)
 
-            assert method.get_brightness()[0] == brightness // scale
+            assert method.get_brightness()[0] == round(brightness / scale)
+
+        @pytest.mark.parametrize('max_brightness', (100, 120, 255, 937, 19393))
+        def test_set_values_are_read_back(self, mocker: MockerFixture, method: Type[BrightnessMethod], max_brightness: int):
+            display = method.get_display_info()[0]
+            display['scale'] = max_brightness / 100
+            mocker.patch.object(method, 'get_display_info', Mock(return_value=[display]), spec=True)
+            mock = mocker.patch.object(sbc.linux, 'open', mocker.mock_open(), spec=True)
+            for value in range(101):
+                method.set_brightness(value)
+            written = iter([c.args[0] for c in mock().write.call_args_list])
+
+            mocker.patch.object(sbc.linux, 'open', Mock(side_effect=lambda *_: io.StringIO(next(written))))
+            assert [method.get_brightness()[0] for _ in range(101)] == list(range(101))
 
     class TestSetBrightness(BrightnessMethodTest.TestSetBrightness):
         class TestDisplayKwarg(BrightnessMethodTest.TestSetBrightness.TestDisplayKwarg):
@@ -111,6 +139,7 @@ class TestI2C(BrightnessMethodTest):
     @pytest.fixture(scope='function', autouse=True)
     def cleanup(self, method: linux.I2C):
         method._max_brightness_cache = {}
+        sbc.linux.__cache__._store = {}
 
     @pytest.fixture
     def patch_get_display_info(self, mocker: MockerFixture):
@@ -140,6 +169,16 @@ class TestI2C(BrightnessMethodTest):
         def test_display_filtering(self, mocker: MockerFixture, original_os_module, method):
             return super().test_display_filtering(mocker, original_os_module, method, {'include': ['i2c_bus']})
 
+        def test_invalidate_monitor_cache(self, monkeypatch: MonkeyPatch, original_os_module, method):
+            monkeypatch.setattr(sbc, '_OS_MODULE', original_os_module)
+            fake = [{'name': 'stale display'}]
+            linux.__cache__.store('i2c_display_info', fake, expires=2)
+            assert sbc.list_monitors_info(method='i2c', allow_duplicates=True) == fake
+            sbc.invalidate_monitor_cache()
+            displays = sbc.list_monitors_info(method='i2c', allow_duplicates=True)
+            assert displays != fake
+            assert displays == method.get_display_info()
+
     class TestGetBrightness(BrightnessMethodTest.TestGetBrightness):
         class TestDisplayKwarg(BrightnessMethodTest.TestGetBrightness.TestDisplayKwarg):
             def test_with(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info, subtests):
@@ -157,7 +196,27 @@ class TestI2C(BrightnessMethodTest):
                 called_devices = [i[0][0] for i in spy.call_args_list]
                 assert paths == called_devices
 
+        def test_values_are_cached(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info):
+            spy = mocker.spy(method, 'DDCInterface')
+            assert method.get_brightness() == method.get_brightness()
+            assert spy.call_count == len(freeze_display_info)
+
     class TestSetBrightness(BrightnessMethodTest.TestSetBrightness):
+        def test_cached_value_is_expired(self, mocker: MockerFixture, method: Type[BrightnessMethod]):
+            # set before the max brightness is known, so that the old value is read and cached
+            method.set_brightness(50, display=0)
+            spy = mocker.spy(method, 'DDCInterface')
+            method.get_brightness(display=0)
+            spy.assert_called_once()
+
+        def test_scaling_is_per_display(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info):
+            assert len(freeze_display_info) > 1, 'setup has gone wrong!'
+            for device in freeze_display_info:
+                method._max_brightness_cache[f'{device["name"]}-{device["model"]}-{device["serial"]}'] = 200
+            spy = mocker.spy(MockI2C.MockDDCInterface, 'setvcp')
+            method.set_brightness(50)
+            assert [c.args[-1] for c in spy.call_args_list] == [100] * len(freeze_display_info)
+
         class TestDisplayKwarg(BrightnessMethodTest.TestSetBrightness.TestDisplayKwarg):
             def test_with(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info, subtests):
                 spy = mocker.spy(method, 'DDCInterface')
@@ -212,6 +271,13 @@ class TestXRandr(BrightnessMethodTest):
                 for d in with_brightness
             )
 
+        @pytest.mark.parametrize('enable_current', [True, False])
+        def test_enable_current(self, mocker: MockerFixture, method: Type[linux.XRandr], enable_current: bool):
+            mocker.patch.object(method, 'enable_current', enable_current)
+            spy = mocker.spy(sbc.linux, 'check_output')
+            method.get_display_info()
+            assert ('--current' in spy.mock_calls[0].args[0]) is enable_current
+
         def test_wayland(self, method: Type[linux.XRandr], monkeypatch: MonkeyPatch):
             monkeypatch.setitem(os.environ, 'WAYLAND_DISPLAY', 'wayland-0')
             assert method.get_display_info() == [], 'wayland displays not supported by xrandr'
@@ -300,6 +366,18 @@ class TestDDCUtil(BrightnessMethodTest):
         def patch(self, patch_set_brightness):
             sbc.linux.__cache__._store = {}
 
+        def test_scaling_is_per_display(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info):
+            assert len(freeze_display_info) > 1, 'setup has gone wrong!'
+            max_values = [200 * (i + 1) for i in range(len(freeze_display_info))]
+            mocker.patch.object(method, '_max_brightness_cache', {
+                f'{device["name"]}-{device["serial"]}-{device["bin_serial"]}': max_value
+                for device, max_value in zip(freeze_display_info, max_values)
+            })
+            spy = mocker.spy(sbc.linux, 'check_output')
+            method.set_brightness(50)
+            set_values = [int(i[i.index('setvcp') + 2]) for i in map(lambda x: x[0][0], spy.call_args_list)]
+            assert set_values == [max_value // 2 for max_value in max_values]
+
         class TestDisplayKwarg(BrightnessMethodTest.TestSetBrightness.TestDisplayKwarg):
             def test_with(self, mocker: MockerFixture, method: Type[BrightnessMethod], freeze_display_info, subtests):
                 spy = mocker.spy(sbc.linux, 'check_output')
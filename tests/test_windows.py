@@ -12,6 +12,7 @@ from screen_brightness_control.helpers import BrightnessMethod
 from .helpers import BrightnessMethodTest
 from .mocks.windows_mock import (
     FakeWinDLL,
+    FakeWMI,
     mock_enum_display_devices,
     mock_enum_display_monitors,
     mock_wmi_init,
@@ -26,6 +27,63 @@ def patch_global_get_display_info(mocker: MockerFixture):
     mocker.patch.object(sbc.windows.win32api, 'EnumDisplayMonitors', mock_enum_display_monitors)
 
 
+class TestWmiInit:
+    @pytest.fixture(autouse=True)
+    def cleanup(self):
+        sbc.windows._wmi_local.wmi = None
+        yield
+        sbc.windows._wmi_local.wmi = None
+
+    @pytest.fixture
+    def pythoncom(self, mocker: MockerFixture):
+        return mocker.patch.object(sbc.windows, 'pythoncom', Mock())
+
+    @pytest.fixture
+    def wmi_connect(self, mocker: MockerFixture, pythoncom):
+        return mocker.patch.object(sbc.windows.wmi, 'WMI', Mock(side_effect=lambda **_: FakeWMI()))
+
+    def test_connection_is_reused(self, wmi_connect):
+        with sbc.windows._wmi_init() as first:
+            pass
+        with sbc.windows._wmi_init() as second:
+            pass
+        assert first is second
+        wmi_connect.assert_called_once_with(namespace='wmi')
+
+    def test_connection_is_dropped_on_error(self, wmi_connect):
+        with sbc.windows._wmi_init():
+            pass
+        with pytest.raises(RuntimeError):
+            with sbc.windows._wmi_init():
+                raise RuntimeError()
+        assert sbc.windows._wmi_local.wmi is None
+        with sbc.windows._wmi_init():
+            pass
+        assert wmi_connect.call_count == 2
+
+    def test_connection_is_not_cached_if_first_use_fails(self, wmi_connect):
+        with pytest.raises(RuntimeError):
+            with sbc.windows._wmi_init():
+                raise RuntimeError()
+        assert sbc.windows._wmi_local.wmi is None
+
+    def test_connection_is_not_cached_after_com_init(self, mocker: MockerFixture, pythoncom):
+        mocker.patch.object(sbc.windows.wmi, 'WMI', Mock(side_effect=[Exception('not initialised'), FakeWMI()]))
+        with sbc.windows._wmi_init():
+            pythoncom.CoInitialize.assert_called_once()
+            pythoncom.CoUninitialize.assert_not_called()
+        pythoncom.CoUninitialize.assert_called_once()
+        assert sbc.windows._wmi_local.wmi is None
+
+    def test_com_is_uninitialised_on_error(self, mocker: MockerFixture, pythoncom):
+        mocker.patch.object(sbc.windows.wmi, 'WMI', Mock(side_effect=[Exception('not initialised'), FakeWMI()]))
+        with pytest.raises(RuntimeError):
+            with sbc.windows._wmi_init():
+                raise RuntimeError()
+        pythoncom.CoUninitialize.assert_called_once()
+        assert sbc.windows._wmi_local.wmi is None
+
+
 class TestWMI(BrightnessMethodTest):
     @pytest.fixture
     def patch_get_display_info(self, patch_global_get_display_info):